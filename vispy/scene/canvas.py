@@ -10,7 +10,7 @@ import numpy as np
 from .. import gloo
 from .. import app
 from .visuals import VisualNode
-from ..visuals.transforms import TransformSystem
+from ..visuals.transforms import TransformSystem, TransformCache
 from ..color import Color
 from ..util import logger, Frozen
 from ..util.profiler import Profiler
@@ -125,6 +125,8 @@ class SceneCanvas(app.Canvas, Frozen):
         self._vp_stack = []
         self._mouse_handler = None
         self.transforms = TransformSystem(canvas=self)
+        # shared by Node.node_transform() for all nodes in this canvas
+        self._transform_cache = TransformCache(max_age=None, max_size=1024)
         self._bgcolor = Color(bgcolor).rgba
 
         # Set to True to enable sending mouse events even when no button is
@@ -275,6 +277,9 @@ class SceneCanvas(app.Canvas, Frozen):
         if bgcolor is None:
             bgcolor = self._bgcolor
         self.context.clear(color=bgcolor, depth=True)
+        # start a new generation of node transforms; those not used since
+        # the last frame may be evicted once the cache is full
+        self._transform_cache.roll()
         self.draw_visual(self.scene)
 
     def draw_visual(self, visual, event=None):
@@ -302,11 +307,9 @@ class SceneCanvas(app.Canvas, Frozen):
             order = self._draw_order[visual]
 
             # draw (while avoiding branches with visible=False)
-            stack = []
             invisible_node = None
             for node, start in order:
                 if start:
-                    stack.append(node)
                     if invisible_node is None:
                         if not node.visible:
                             # disable drawing until we exit this node's subtree
@@ -315,10 +318,8 @@ class SceneCanvas(app.Canvas, Frozen):
                             if hasattr(node, 'draw'):
                                 node.draw()
                                 prof.mark(str(node))
-                else:
-                    if node is invisible_node:
-                        invisible_node = None
-                    stack.pop()
+                elif node is invisible_node:
+                    invisible_node = None
         finally:
             self._drawing = False
 
@@ -512,7 +513,7 @@ class SceneCanvas(app.Canvas, Frozen):
         if self._central_widget is not None:
             self._central_widget.size = self.size
 
-        if len(self._vp_stack) == 0:
+        if not self._vp_stack:
             self.context.set_viewport(0, 0, *self.physical_size)
 
     def on_close(self, event):
@@ -561,7 +562,7 @@ class SceneCanvas(app.Canvas, Frozen):
         """Pop a viewport from the stack."""
         vp = self._vp_stack.pop()
         # Activate latest
-        if len(self._vp_stack) > 0:
+        if self._vp_stack:
             self.context.set_viewport(*self._vp_stack[-1])
         else:
             self.context.set_viewport(0, 0, *self.physical_size)
@@ -592,30 +593,29 @@ class SceneCanvas(app.Canvas, Frozen):
         try:
             fbo.activate()
             h, w = fbo.color_buffer.shape[:2]
+            # also updates the transforms for the new framebuffer
             self.push_viewport((0, 0, w, h))
         except Exception:
             self._fb_stack.pop()
             raise
 
-        self._update_transforms()
-
     def pop_fbo(self):
         """Pop an FBO from the stack."""
         fbo = self._fb_stack.pop()
         fbo[0].deactivate()
+        # also updates the transforms for the restored framebuffer
         self.pop_viewport()
-        if len(self._fb_stack) > 0:
+        if self._fb_stack:
             old_fbo = self._fb_stack[-1]
             old_fbo[0].activate()
 
-        self._update_transforms()
         return fbo
 
     def _current_framebuffer(self):
         """Return (fbo, origin, canvas_size) for the current
         FBO on the stack, or for the canvas if there is no FBO.
         """
-        if len(self._fb_stack) == 0:
+        if not self._fb_stack:
             return None, (0, 0), self.size
         else:
             return self._fb_stack[-1]
@@ -624,13 +624,13 @@ class SceneCanvas(app.Canvas, Frozen):
         """Update the canvas's TransformSystem to correct for the current
         canvas size, framebuffer, and viewport.
         """
-        if len(self._fb_stack) == 0:
+        if not self._fb_stack:
             fb_size = fb_rect = None
         else:
             fb, origin, fb_size = self._fb_stack[-1]
             fb_rect = origin + fb_size
 
-        if len(self._vp_stack) == 0:
+        if not self._vp_stack:
             viewport = None
         else:
             viewport = self._vp_stack[-1]
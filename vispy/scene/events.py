@@ -14,6 +14,8 @@ class SceneMouseEvent(Event):
 
     def __init__(self, event, visual):
         self.mouse_event = event
+        self._last_event = None
+        self._press_event = None
         self.visual = visual
         Event.__init__(self, type=event.type)
 
@@ -25,6 +27,12 @@ class SceneMouseEvent(Event):
     def visual(self, v):
         self._visual = v
         self._pos = None
+        # Derived events are re-targeted along with this event (e.g. when it
+        # is passed on to the parent visual) rather than created again.
+        if self._last_event is not None:
+            self._last_event.visual = v
+        if self._press_event is not None:
+            self._press_event.visual = v
 
     @property
     def pos(self):
@@ -41,19 +49,29 @@ class SceneMouseEvent(Event):
         """The mouse event immediately prior to this one. This
         property is None when no mouse buttons are pressed.
         """
-        if self.mouse_event.last_event is None:
+        last_event = self.mouse_event.last_event
+        if last_event is None:
             return None
-        ev = self.copy()
-        ev.mouse_event = self.mouse_event.last_event
+        # Derived events are created on first access and reused afterwards,
+        # so that their mapped position is only computed once.
+        ev = self._last_event
+        if ev is None or ev.mouse_event is not last_event:
+            ev = self.copy()
+            ev.mouse_event = last_event
+            self._last_event = ev
         return ev
 
     @property
     def press_event(self):
         """The mouse press event that initiated a mouse drag, if any."""
-        if self.mouse_event.press_event is None:
+        press_event = self.mouse_event.press_event
+        if press_event is None:
             return None
-        ev = self.copy()
-        ev.mouse_event = self.mouse_event.press_event
+        ev = self._press_event
+        if ev is None or ev.mouse_event is not press_event:
+            ev = self.copy()
+            ev.mouse_event = press_event
+            self._press_event = ev
         return ev
 
     @property
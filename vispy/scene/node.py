@@ -9,7 +9,7 @@ from contextlib import contextmanager
 
 from ..util.event import Event, EmitterGroup
 from ..visuals.transforms import (NullTransform, BaseTransform, 
-                                  ChainTransform, create_transform,
+                                  TransformCache, create_transform,
                                   TransformSystem)
 
 
@@ -47,6 +47,8 @@ class Node(object):
         self._canvas = None
         self._document_node = None
         self._scene_node = None
+        self._parent_chain = None
+        self._node_transform_cache = None
         self._opacity = 1.0
         self._order = 0
         self._picking = False
@@ -232,6 +234,7 @@ class Node(object):
             The event.
         """
         self._scene_node = None
+        self._parent_chain = None
 
     def is_child(self, node):
         """Check if a node is a child of the current node
@@ -274,7 +277,7 @@ class Node(object):
     @document_node.setter
     def document_node(self, doc):
         self._document_node = doc
-        self._update_transform()
+        self._update_trsys(None)
 
     @property
     def scene_node(self):
@@ -295,12 +298,7 @@ class Node(object):
 
     @property
     def root_node(self):
-        node = self
-        while True:
-            p = node.parent
-            if p is None:
-                return node
-            node = p
+        return self.parent_chain()[-1]
 
     def _set_canvas(self, c):
         old = self.canvas
@@ -405,6 +403,13 @@ class Node(object):
         Return the list of parents starting from this node. The chain ends
         at the first node with no parents.
         """
+        # The chain is cached (as weak references, like the parent link
+        # itself) until a parent_change event is received by this node.
+        if self._parent_chain is not None:
+            chain = [ref() for ref in self._parent_chain]
+            if None not in chain:
+                return chain
+
         chain = [self]
         while True:
             try:
@@ -414,6 +419,7 @@ class Node(object):
             if parent is None:
                 break
             chain.append(parent)
+        self._parent_chain = [weakref.ref(node) for node in chain]
         return chain
 
     def describe_tree(self, with_transform=False):
@@ -465,10 +471,9 @@ class Node(object):
         parent : instance of Node | None
             The parent.
         """
-        p1 = self.parent_chain()
-        p2 = node.parent_chain()
-        for p in p1:
-            if p in p2:
+        p2 = set(map(id, node.parent_chain()))
+        for p in self.parent_chain():
+            if id(p) in p2:
                 return p
         return None
 
@@ -555,20 +560,20 @@ class Node(object):
             ([D, C, B], [E, F])
 
         """
+        if node is self:
+            return [self], []
+
         p1 = self.parent_chain()
         p2 = node.parent_chain()
-        cp = None
-        for p in p1:
-            if p in p2:
-                cp = p
-                break
-        if cp is None:
-            raise RuntimeError("No single-path common parent between nodes %s "
-                               "and %s." % (self, node))
-
-        p1 = p1[:p1.index(cp)+1]
-        p2 = p2[:p2.index(cp)][::-1]
-        return p1, p2
+        # Index the other chain so that the common parent is found in a
+        # single pass, rather than scanning p2 for every node of p1.
+        p2_index = {id(p): j for j, p in enumerate(p2)}
+        for i, p in enumerate(p1):
+            j = p2_index.get(id(p))
+            if j is not None:
+                return p1[:i+1], p2[:j][::-1]
+        raise RuntimeError("No single-path common parent between nodes %s "
+                           "and %s." % (self, node))
 
     def node_path_transforms(self, node):
         """Return the list of transforms along the path to another node.
@@ -587,9 +592,14 @@ class Node(object):
         transforms : list
             A list of Transform instances.
         """
+        if node is self:
+            return []
+
         a, b = self.node_path(node)
-        return ([n.transform for n in a[:-1]] + 
-                [n.transform.inverse for n in b])[::-1]
+        # Build the list directly in application order; inverses are cached
+        # by the transforms themselves (BaseTransform.inverse).
+        return ([n.transform.inverse for n in reversed(b)] +
+                [n.transform for n in a[-2::-1]])
 
     def node_transform(self, node):
         """
@@ -607,9 +617,23 @@ class Node(object):
         Returns
         -------
         transform : instance of ChainTransform
-            The transform.
+            The transform. This instance is cached and shared with other
+            callers (and other nodes of the same canvas) requesting the same
+            path; it must not be modified.
         """
-        return ChainTransform(self.node_path_transforms(node))
+        # Return the same ChainTransform for as long as the transforms along
+        # the path are unchanged, so that its shaders are not rebuilt. Nodes
+        # in a canvas share its cache, which only evicts chains unused since
+        # the last frame once it is full.
+        canvas = self.canvas
+        if canvas is not None:
+            cache = canvas._transform_cache
+        else:
+            cache = self._node_transform_cache
+            if cache is None:
+                cache = self._node_transform_cache = TransformCache()
+            cache.roll()
+        return cache.get(self.node_path_transforms(node))
 
     def __repr__(self):
         name = "" if self.name is None else " name="+self.name
@@ -117,3 +117,37 @@ def test_blend_presets(preset):
 
         rgba_result = c.render()
         assert not np.allclose(rgba_result[..., :3], 0)
+
+
+@requires_application()
+def test_nested_fbo_transforms():
+    """Test that pushing and popping FBOs keeps the transforms current."""
+    with TestingCanvas(size=(125, 125), show=True, title='run') as c:
+        pts = np.array([[0, 0], [10, 20], [125, 125]])
+
+        def state():
+            trs = c.transforms
+            return [trs.get_transform(a, 'render').map(pts)
+                    for a in ('canvas', 'framebuffer')]
+
+        def assert_state(expected):
+            for result, exp in zip(state(), expected):
+                np.testing.assert_allclose(result, exp, atol=1e-6)
+
+        base = state()
+        fbo1 = gloo.FrameBuffer(color=gloo.RenderBuffer((50, 60, 4)))
+        fbo2 = gloo.FrameBuffer(color=gloo.RenderBuffer((20, 30, 4)))
+
+        c.push_fbo(fbo1, (0, 0), (60, 50))
+        outer = state()
+        # framebuffer coordinates now span fbo1
+        fb_to_render = c.transforms.get_transform('framebuffer', 'render')
+        np.testing.assert_allclose(fb_to_render.map([[0, 0], [60, 50]]),
+                                   [[-1, -1, 0, 1], [1, 1, 0, 1]], atol=1e-6)
+
+        c.push_fbo(fbo2, (10, 20), (30, 20))
+        assert not np.allclose(state()[1], outer[1])
+        c.pop_fbo()
+        assert_state(outer)
+        c.pop_fbo()
+        assert_state(base)
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+
+from vispy import scene
+from vispy.app import MouseEvent
+from vispy.scene.events import SceneMouseEvent
+from vispy.scene.node import Node
+from vispy.scene.subscene import SubScene
+from vispy.testing import run_tests_if_main
+from vispy.visuals.transforms import STTransform
+
+
+def test_scene_mouse_event_derived_events():
+    press = MouseEvent('mouse_press', pos=(1, 2), button=1)
+    last = MouseEvent('mouse_move', pos=(3, 4), press_event=press)
+    move = MouseEvent('mouse_move', pos=(5, 6), press_event=press,
+                      last_event=last)
+    node = Node()
+    ev = SceneMouseEvent(move, node)
+
+    # derived events are created once and reused
+    last_ev = ev.last_event
+    press_ev = ev.press_event
+    assert last_ev.mouse_event is last
+    assert press_ev.mouse_event is press
+    assert last_ev.visual is node
+    assert ev.last_event is last_ev
+    assert ev.press_event is press_ev
+
+    # a new derived event is built when the underlying event changes
+    last2 = MouseEvent('mouse_move', pos=(7, 8), press_event=press)
+    ev.mouse_event = MouseEvent('mouse_move', pos=(9, 10), press_event=press,
+                                last_event=last2)
+    assert ev.last_event is not last_ev
+    assert ev.last_event.mouse_event is last2
+    assert ev.press_event is press_ev
+
+    # no derived events without a last/press event
+    ev = SceneMouseEvent(MouseEvent('mouse_move', pos=(0, 0)), node)
+    assert ev.last_event is None
+    assert ev.press_event is None
+
+
+def test_scene_mouse_event_retarget():
+    root = SubScene()
+    line1 = scene.visuals.Line(parent=root)
+    line1.transform = STTransform(translate=(10, 0))
+    line2 = scene.visuals.Line(parent=root)
+    line2.transform = STTransform(scale=(2, 2))
+
+    press = MouseEvent('mouse_press', pos=(20, 4), button=1)
+    move = MouseEvent('mouse_move', pos=(5, 6), press_event=press)
+    ev = SceneMouseEvent(move, line1)
+    press_ev = ev.press_event
+    assert np.allclose(press_ev.pos[:2], (10, 4))
+
+    # passing the event on re-targets the derived events as well
+    ev.visual = line2
+    assert ev.press_event is press_ev
+    assert press_ev.visual is line2
+    assert np.allclose(press_ev.pos[:2], (10, 2))
+    assert np.allclose(ev.pos[:2], (2.5, 3))
+
+
+run_tests_if_main()
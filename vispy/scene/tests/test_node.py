@@ -2,7 +2,8 @@
 from vispy.scene.node import Node
 from vispy.testing import (requires_application, TestingCanvas,
                            run_tests_if_main, raises)
-from vispy.visuals.transforms import STTransform
+from vispy.visuals.transforms import (STTransform, TransformCache,
+                                      TransformSystem)
 import numpy as np
 
 
@@ -109,6 +110,8 @@ def test_transforms():
     assert n4.node_path(n2) == ([n4, n3, root], [n1, n2])
     assert n2.node_path(root) == ([n2, n1, root], [])
     assert root.node_path(n4) == ([root], [n3, n4])
+    assert n2.node_path(n2) == ([n2], [])
+    assert n2.node_path_transforms(n2) == []
     assert n2.node_path_transforms(n4) == [n4.transform.inverse, 
                                            n3.transform.inverse, 
                                            n1.transform, n2.transform]
@@ -129,8 +132,19 @@ def test_transforms():
                   n4.transform.inverse.map(n3.transform.inverse.map(
                       n1.transform.map(n2.transform.map(pts)))))
 
+    # transforms are reused until a transform along the path is replaced
+    tr = n2.node_transform(n4)
+    assert n2.node_transform(n4) is tr
+    n1.transform = STTransform(scale=(0.1, 0.1), translate=(7, 6))
+    assert n2.node_transform(n4) is not tr
+    assert np.all(n2.node_transform(n4).map(pts) == 
+                  n4.transform.inverse.map(n3.transform.inverse.map(
+                      n1.transform.map(n2.transform.map(pts)))))
+
     # test transforms still work after reparenting
+    assert n4.parent_chain() == [n4, n3, root]
     n3.parent = n1
+    assert n4.parent_chain() == [n4, n3, n1, root]
     assert np.all(n2.node_transform(n4).map(pts) == n4.transform.inverse.map(
         n3.transform.inverse.map(n2.transform.map(pts))))
 
@@ -138,5 +152,74 @@ def test_transforms():
     assert np.all(n2.node_transform(n4).map(pts) == 
                   n2.node_transform(n4).simplified.map(pts))    
 
+    # assigning a document node updates the transforms
+    tr_check = EventCheck(n2.events.transform_change)
+    assert n2.document_node is root
+    n2.document_node = n1
+    assert n2.document_node is n1
+    assert len(tr_check.events) == 1
+
+
+class CanvasStub(object):
+    """The parts of SceneCanvas used by Node, without a GL backend."""
+
+    def __init__(self):
+        self.transforms = TransformSystem()
+        self._transform_cache = TransformCache(max_age=None, max_size=4)
+
+    def update(self, node=None):
+        pass
+
+
+def test_node_transform_cache():
+    canvas = CanvasStub()
+    cache = canvas._transform_cache
+    root = Node()
+    root._set_canvas(canvas)
+    n1 = Node(parent=root)
+    n2 = Node(parent=root)
+    assert n1.canvas is canvas
+
+    # nodes of a canvas share chains for the same path
+    tr = STTransform(translate=(1, 2))
+    n1.transform = tr
+    n2.transform = tr
+    chain = n1.node_transform(root)
+    assert n2.node_transform(root) is chain
+
+    # chains of a static scene survive frames in which they are not used
+    for i in range(10):
+        cache.roll()
+    assert n1.node_transform(root) is chain
+
+    # once the cache is full, chains used in the current frame survive...
+    nodes = [Node(parent=root) for i in range(2 * cache.max_size)]
+    cache.roll()
+    chains = [n.node_transform(root) for n in nodes]
+    assert all(n.node_transform(root) is ch for n, ch in zip(nodes, chains))
+    cache.roll()
+    assert all(n.node_transform(root) is ch for n, ch in zip(nodes, chains))
+    # ...and those not used since the last frame are evicted first
+    cache.roll()
+    chain = n1.node_transform(root)
+    n2.node_transform(root)
+    new = Node(parent=root)
+    new.node_transform(root)
+    assert len(cache._cache) == cache.max_size
+    assert n1.node_transform(root) is chain
+    assert nodes[0].node_transform(root) is not chains[0]
+
+
+def test_transform_cache_max_age():
+    # default caches (detached nodes, cameras) expire items by age
+    cache = TransformCache()
+    path = [STTransform(), STTransform()]
+    chain = cache.get(path)
+    cache.roll()
+    cache.roll()
+    assert cache.get(path) is chain
+    for i in range(cache.max_age + 2):
+        cache.roll()
+    assert cache.get(path) is not chain
 
 run_tests_if_main()
@@ -80,9 +80,13 @@ class VisualNode(Node):
         """Transform object(s) have changed for this Node; assign these to the
         visual's TransformSystem.
         """
-        doc = self.document_node
-        scene = self.scene_node
+        # Resolve the root once; it is also the default document node, so
+        # reading document_node would walk up to it a second time.
         root = self.root_node
+        doc = self._document_node
+        if doc is None:
+            doc = root
+        scene = self.scene_node
         self.transforms.visual_transform = self.node_transform(scene)
         self.transforms.scene_transform = scene.node_transform(doc)
         self.transforms.document_transform = doc.node_transform(root)
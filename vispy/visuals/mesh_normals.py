@@ -28,6 +28,10 @@ class MeshNormalsVisual(LineVisual):
         maximum side length of the bounding box of the mesh.
     length_scale : float, default=1.0
         A scale factor applied to the length computed with `length_method`.
+    normals_are_unit : bool, default=False
+        Whether the normals provided by `meshdata` are already of unit
+        length. If True, the normals are used as-is instead of being
+        normalized.
     **kwargs : dict, optional
         Extra arguments to define the appearance of lines. Refer to
         :class:`~vispy.visuals.line.line.LineVisual`.
@@ -75,13 +79,16 @@ class MeshNormalsVisual(LineVisual):
     """
 
     def __init__(self, meshdata=None, primitive='face', length=None,
-                 length_method='median_edge', length_scale=1.0, **kwargs):
+                 length_method='median_edge', length_scale=1.0,
+                 normals_are_unit=False, **kwargs):
         self._previous_meshdata = None
         super().__init__(connect='segments')
-        self.set_data(meshdata, primitive, length, length_method, length_scale, **kwargs)
+        self.set_data(meshdata, primitive, length, length_method, length_scale,
+                      normals_are_unit, **kwargs)
 
     def set_data(self, meshdata=None, primitive='face', length=None,
-                 length_method='median_edge', length_scale=1.0, **kwargs):
+                 length_method='median_edge', length_scale=1.0,
+                 normals_are_unit=False, **kwargs):
         """Set the data used to draw this visual
 
         Parameters
@@ -99,6 +106,10 @@ class MeshNormalsVisual(LineVisual):
             maximum side length of the bounding box of the mesh.
         length_scale : float, default=1.0
             A scale factor applied to the length computed with `length_method`.
+        normals_are_unit : bool, default=False
+            Whether the normals provided by `meshdata` are already of unit
+            length. If True, the normals are used as-is instead of being
+            normalized.
         **kwargs : dict, optional
             Extra arguments to define the appearance of lines. Refer to
             :class:`~vispy.visuals.line.line.LineVisual`.
@@ -125,17 +136,29 @@ class MeshNormalsVisual(LineVisual):
 
         self._previous_meshdata = meshdata
 
-        norms = np.sqrt((normals ** 2).sum(axis=-1, keepdims=True))
-        unit_normals = normals / norms
+        # The segments end up as float32 on the GPU: cast the inputs once and
+        # do all the arithmetic below in float32 rather than in the (often
+        # float64) precision of the mesh data.
+        normals = np.asarray(normals, dtype=np.float32)
+
+        # The face corners are shared by the face origins and the median edge
+        # length; fetch them once if either needs them.
+        face_corners = None
+        if primitive == 'face' or (length is None and
+                                   length_method == 'median_edge'):
+            face_corners = np.asarray(meshdata.get_vertices(indexed='faces'),
+                                      dtype=np.float32)
 
         if length is None and length_method == 'median_edge':
-            face_corners = meshdata.get_vertices(indexed='faces')
-            edges = np.stack((
-                face_corners[:, 1, :] - face_corners[:, 0, :],
-                face_corners[:, 2, :] - face_corners[:, 1, :],
-                face_corners[:, 0, :] - face_corners[:, 2, :],
-            ))
-            edge_lengths = np.sqrt((edges ** 2).sum(axis=-1))
+            n_faces = len(face_corners)
+            # Accumulate the squared lengths of the edges 0->1, 1->2 and 2->0
+            # into a single buffer, one edge at a time.
+            edge_lengths = np.empty(3 * n_faces, dtype=np.float32)
+            for i in range(3):
+                edge = face_corners[:, (i + 1) % 3] - face_corners[:, i]
+                np.einsum('ij,ij->i', edge, edge,
+                          out=edge_lengths[i * n_faces:(i + 1) * n_faces])
+            np.sqrt(edge_lengths, out=edge_lengths)
             length = np.median(edge_lengths)
         elif length is None and length_method == 'max_extent':
             vertices = meshdata.get_vertices()
@@ -143,17 +166,36 @@ class MeshNormalsVisual(LineVisual):
             length = max_extent
         length *= length_scale
 
-        if primitive == 'face':
-            origins = meshdata.get_vertices(indexed='faces')
-            origins = origins.mean(axis=1)
-        elif primitive == 'vertex':
-            origins = meshdata.get_vertices()
-
         # Ensure the broadcasting if the input is an `(n,)` array.
-        length = np.atleast_1d(length)
-        length = length[:, None]
+        length = np.atleast_1d(np.asarray(length, dtype=np.float32))
 
-        ends = origins + length * unit_normals
-        segments = np.hstack((origins, ends)).reshape(-1, 3)
+        # Fold the normalization into the per-normal scale factor, so that
+        # the ends are computed in a single pass over the normals without an
+        # intermediate array of unit normals.
+        if normals_are_unit:
+            scale = length
+        else:
+            # einsum squares and sums in a single pass, without an (N, 3)
+            # temporary for the squared components.
+            norms = np.einsum('ij,ij->i', normals, normals)
+            np.sqrt(norms, out=norms)
+            scale = length / norms
+
+        # Interleave origins and ends in the layout expected by the
+        # 'segments' connect mode, computing both directly in place.
+        segments = np.empty((2 * len(normals), 3), dtype=np.float32)
+        origins = segments[0::2]
+        if primitive == 'face':
+            # MeshData caches the vertices indexed by faces (they were already
+            # needed for the face normals), so sum the three corners from it
+            # rather than gathering vertices[faces] again.
+            np.add(face_corners[:, 0], face_corners[:, 1], out=origins)
+            origins += face_corners[:, 2]
+            origins /= 3
+        elif primitive == 'vertex':
+            origins[...] = meshdata.get_vertices()
+        ends = segments[1::2]
+        np.multiply(normals, scale[:, None], out=ends)
+        ends += origins
 
         super().set_data(pos=segments, connect='segments', **kwargs)
@@ -215,4 +215,40 @@ def test_mesh_normals_empty():
     scene.visuals.MeshNormals(mesh.mesh_data)
 
 
+def test_mesh_normals_are_unit():
+    meshdata = create_sphere(radius=1.0)
+    # vertex normals are returned normalized by MeshData
+    normals = scene.visuals.MeshNormals(meshdata, primitive='vertex')
+    unit_normals = scene.visuals.MeshNormals(meshdata, primitive='vertex',
+                                             normals_are_unit=True)
+    np.testing.assert_allclose(unit_normals.pos, normals.pos, rtol=1e-5)
+
+
+def _face_normals_reference(meshdata):
+    face_corners = meshdata.get_vertices(indexed='faces')
+    origins = face_corners.mean(axis=1)
+    normals = meshdata.get_face_normals()
+    unit_normals = normals / np.linalg.norm(normals, axis=1, keepdims=True)
+    edges = face_corners - np.roll(face_corners, 1, axis=1)
+    median_edge = np.median(np.linalg.norm(edges, axis=-1))
+    return origins, unit_normals, median_edge
+
+
+def test_mesh_normals_face_values():
+    meshdata = create_sphere(radius=1.0)
+    origins, unit_normals, median_edge = _face_normals_reference(meshdata)
+
+    normals = scene.visuals.MeshNormals(meshdata, primitive='face')
+    np.testing.assert_allclose(normals.pos[0::2], origins, atol=1e-6)
+    np.testing.assert_allclose(normals.pos[1::2] - normals.pos[0::2],
+                               unit_normals * median_edge, atol=1e-6)
+
+    lengths = np.linspace(0.1, 1.0, len(origins))
+    normals = scene.visuals.MeshNormals(meshdata, primitive='face',
+                                        length=lengths)
+    np.testing.assert_allclose(normals.pos[0::2], origins, atol=1e-6)
+    np.testing.assert_allclose(normals.pos[1::2] - normals.pos[0::2],
+                               unit_normals * lengths[:, None], atol=1e-6)
+
+
 run_tests_if_main()
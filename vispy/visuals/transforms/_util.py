@@ -5,6 +5,7 @@
 from __future__ import division
 
 import functools
+from collections import OrderedDict
 
 import numpy as np
 from ...util import logger
@@ -133,20 +134,32 @@ class TransformCache(object):
     """Utility class for managing a cache of ChainTransforms.
 
     This is an LRU cache; items are removed if they are not accessed after
-    *max_age* calls to roll().
+    *max_age* calls to roll(). If *max_age* is None, items never expire
+    by age.
+
+    If *max_size* is given, adding an item to a cache that holds more than
+    *max_size* items first evicts the least recently used items that were
+    not accessed since the last call to roll(). Items accessed since then
+    are never evicted this way, so the cache may exceed *max_size* by the
+    number of distinct items used between two calls to roll().
 
     Notes
     -----
-    This class is used by SceneCanvas to ensure that ChainTransform instances
-    are re-used across calls to draw_visual(). SceneCanvas creates one
-    TransformCache instance for each top-level visual drawn, and calls
-    roll() on each cache before drawing, which removes from the cache any
-    transforms that were not accessed during the last draw cycle.
+    This class is used by SceneCanvas to ensure that the ChainTransform
+    instances returned by Node.node_transform() are re-used. SceneCanvas
+    owns one TransformCache shared by all of its nodes, with no *max_age*
+    and a *max_size*. It calls roll() before drawing, so that each frame
+    starts a new generation: chains of a static scene are kept indefinitely,
+    and once the cache is full, chains not used since the previous frame
+    are the first to be dropped.
     """
 
-    def __init__(self, max_age=1):
-        self._cache = {}  # maps {key: [age, transform]}
+    def __init__(self, max_age=1, max_size=None):
+        # maps {key: [generation, transform]}, least recently used first
+        self._cache = OrderedDict()
+        self._generation = 0
         self.max_age = max_age
+        self.max_size = max_size
 
     def get(self, path):
         """Get a transform from the cache that maps along *path*, which must
@@ -156,12 +169,17 @@ class TransformCache(object):
         Accessed items have their age reset to 0.
         """
         key = tuple(map(id, path))
-        item = self._cache.get(key, None)
+        cache = self._cache
+        item = cache.get(key, None)
         if item is None:
             logger.debug("Transform cache miss: %s", key)
-            item = [0, self._create(path)]
-            self._cache[key] = item
-        item[0] = 0  # reset age for this item
+            if self.max_size is not None:
+                self._evict(self.max_size - 1)
+            item = [self._generation, self._create(path)]
+            cache[key] = item
+        else:
+            item[0] = self._generation  # reset age for this item
+            cache.move_to_end(key)
 
         # make sure the chain is up to date
         # tr = item[1]
@@ -176,16 +194,30 @@ class TransformCache(object):
         from .chain import ChainTransform
         return ChainTransform(path)
 
+    def _evict(self, size):
+        # Remove least recently used items not accessed during the current
+        # generation until at most *size* items remain.
+        cache = self._cache
+        while len(cache) > size:
+            key, item = next(iter(cache.items()))
+            if item[0] == self._generation:
+                break
+            logger.debug("TransformCache remove: %s", key)
+            del cache[key]
+
     def roll(self):
         """Increase the age of all items in the cache by 1. Items whose age
         is greater than self.max_age will be removed from the cache.
         """
-        rem = []
-        for key, item in self._cache.items():
-            if item[0] > self.max_age:
-                rem.append(key)
-            item[0] += 1
-
-        for key in rem:
+        self._generation += 1
+        if self.max_age is None:
+            return
+        # items are ordered by age, so only the oldest need to be visited
+        oldest = self._generation - self.max_age - 1
+        cache = self._cache
+        while cache:
+            key, item = next(iter(cache.items()))
+            if item[0] >= oldest:
+                break
             logger.debug("TransformCache remove: %s", key)
-            del self._cache[key]
+            del cache[key]
@@ -240,4 +240,19 @@ def test_inverse(trn):
     # assert np.allclose(abs_pos, tr.inverse.map(tr.map(abs_pos))[:,:3])
 
 
+def test_transform_system_get_transform():
+    trs = tr.TransformSystem()
+    full = trs.get_transform()
+    assert trs.get_transform('visual', 'render') is full
+    assert trs.get_transform('render', 'visual') is not full
+
+    # replacing stage transforms must be reflected by the cached chain
+    trs.visual_transform = ST(scale=(2, 3), translate=(1, 1))
+    trs.framebuffer_transform = ST(translate=(5, 0))
+    assert trs.get_transform() is full
+    assert_allclose(full.map((1, 1))[:2], (8, 4))
+    assert_allclose(trs.get_transform('render', 'visual').map((8, 4))[:2],
+                    (1, 1))
+
+
 run_tests_if_main()
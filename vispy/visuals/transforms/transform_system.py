@@ -84,7 +84,7 @@ class TransformSystem(object):
     Next, we supply the complete chain of transforms when drawing the visual:
 
         def draw(tr_sys):
-            tr = tr_sys.get_full_transform()
+            tr = tr_sys.get_transform()
             self.program['transform'] = tr.shader_map()
             self.program['a_position'] = self.vertex_buffer
             self.program.draw('triangles')
@@ -114,7 +114,7 @@ class TransformSystem(object):
         }
 
     In this case, we need to access
-    the transforms independently, so ``get_full_transform()`` is not useful
+    the transforms independently, so ``get_transform()`` is not useful
     here::
 
         def draw(tr_sys):
@@ -122,7 +122,7 @@ class TransformSystem(object):
             self.program['visual_to_doc'] = tr_sys.visual_to_doc.shader_map()
             doc_to_render = (tr_sys.framebuffer_transform *
                              tr_sys.document_transform)
-            self.program['visual_to_doc'] = doc_to_render.shader_map()
+            self.program['doc_to_render'] = doc_to_render.shader_map()
 
             self.program['u_line_width'] = self.line_width
             self.program['u_dpi'] = tr_sys.dpi
@@ -141,6 +141,7 @@ class TransformSystem(object):
         self._fbo_bounds = None
         self.canvas = canvas
         self._cache = TransformCache()
+        self._cs_transforms = {}  # maps {(map_from, map_to): transform}
         self._dpi = dpi
         self._mappings = {'ct0': None, 'ct1': None, 'ft0': None}
 
@@ -209,10 +210,15 @@ class TransformSystem(object):
         if canvas is None:
             raise RuntimeError("No canvas assigned to this TransformSystem.")
 
+        # Canvas.size and Canvas.physical_size query the backend; read them
+        # only once per call.
+        size = canvas.size
+        physical_size = canvas.physical_size
+
         # By default, this should invert the y axis--canvas origin is in top
         # left, whereas framebuffer origin is in bottom left.
-        map_from = [(0, 0), canvas.size]
-        map_to = [(0, canvas.physical_size[1]), (canvas.physical_size[0], 0)]
+        map_from = [(0, 0), size]
+        map_to = [(0, physical_size[1]), (physical_size[0], 0)]
         self._update_if_maps_changed(self._canvas_transform.transforms[1],
                                      'ct1', np.array((map_from, map_to)))
         if fbo_rect is None:
@@ -228,7 +234,7 @@ class TransformSystem(object):
         if viewport is None:
             if fbo_size is None:
                 # viewport covers entire canvas
-                map_from = [(0, 0), canvas.physical_size]
+                map_from = [(0, 0), physical_size]
             else:
                 # viewport covers entire FBO
                 map_from = [(0, 0), fbo_size]
@@ -321,6 +327,14 @@ class TransformSystem(object):
             The ending coordinate system to map to. Must be one of: visual,
             scene, document, canvas, framebuffer, or render.
         """
+        # The per-stage ChainTransforms are never replaced (setters only
+        # modify their contents), so the chain between any two coordinate
+        # systems can be resolved once and reused for every draw.
+        key = (map_from, map_to)
+        chain = self._cs_transforms.get(key)
+        if chain is not None:
+            return chain
+
         tr = ['visual', 'scene', 'document', 'canvas', 'framebuffer', 'render']
         ifrom = tr.index(map_from)
         ito = tr.index(map_to)
@@ -331,7 +345,9 @@ class TransformSystem(object):
         else:
             trs = [getattr(self, '_' + t + '_transform').inverse
                    for t in tr[ito:ifrom]]
-        return self._cache.get(trs)
+        chain = self._cache.get(trs)
+        self._cs_transforms[key] = chain
+        return chain
 
     @property
     def pixel_scale(self):